@@ -4,15 +4,212 @@ NTPC Company Financial Analysis Presentation Generator
 Creates a comprehensive PowerPoint presentation with financial analysis
 """
 
+import copy
+import functools
+import hashlib
+import os
+import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape
+
+import pptx
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.opc.serialized import PackageWriter, _ZipPkgWriter
+from pptx.util import Inches, Pt, lazyproperty
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 
-def add_title_slide(prs, title, subtitle):
+# Shared colours and measurements, built once at import
+BRAND_BLUE = RGBColor(0, 51, 102)
+WHITE = RGBColor(255, 255, 255)
+ROW_GREY = RGBColor(240, 240, 240)
+PT_44 = Pt(44)
+PT_32 = Pt(32)
+IN_0_5 = Inches(0.5)
+IN_0_8 = Inches(0.8)
+IN_1_5 = Inches(1.5)
+IN_4_5 = Inches(4.5)
+IN_9 = Inches(9)
+SLIDE_WIDTH = Inches(10)
+SLIDE_HEIGHT = Inches(7.5)
+
+# Prebuilt cell fills, deep-copied into each cell's tcPr
+HEADER_FILL_XML = parse_xml(
+    '<a:solidFill %s><a:srgbClr val="%s"/></a:solidFill>' % (nsdecls("a"), BRAND_BLUE)
+)
+ROW_FILL_XML = parse_xml(
+    '<a:solidFill %s><a:srgbClr val="%s"/></a:solidFill>' % (nsdecls("a"), ROW_GREY)
+)
+
+OUTPUT_FILE = "/vercel/sandbox/NTPC_Financial_Analysis_Presentation.pptx"
+WRITE_BUFFER_SIZE = 1 << 20
+
+# os.umask can only be read by setting it, so read it once at import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# Content items starting with this prefix are rendered as level 1 bullets
+BULLET_PREFIX = "  • "
+
+# Content slide body styling, as attribute values in hundredths of a point
+BODY_SZ = "1800"
+BODY_SPACE_BEFORE = "1200"
+BODY_SPACE_AFTER = "1200"
+
+# Parsed once and deep-copied per item: level 1 bullets are "•" bulleted, level 0
+# headings unbulleted
+_BULLET_PROTO = parse_xml(
+    '<a:p %s><a:pPr lvl="1"><a:spcAft><a:spcPts val="%s"/></a:spcAft><a:buChar char="•"/>'
+    '</a:pPr><a:r><a:rPr sz="%s"/><a:t/></a:r></a:p>' % (nsdecls("a"), BODY_SPACE_AFTER, BODY_SZ)
+)
+_HEADING_PROTO = parse_xml(
+    '<a:p %s><a:pPr><a:spcAft><a:spcPts val="%s"/></a:spcAft><a:buNone/>'
+    '</a:pPr><a:r><a:rPr sz="%s"/><a:t/></a:r></a:p>' % (nsdecls("a"), BODY_SPACE_AFTER, BODY_SZ)
+)
+_SPACE_BEFORE_PROTO = parse_xml(
+    '<a:spcBef %s><a:spcPts val="%s"/></a:spcBef>' % (nsdecls("a"), BODY_SPACE_BEFORE)
+)
+
+class _MaxDeflateZipPkgWriter(_ZipPkgWriter):
+    """_ZipPkgWriter that deflates every member at compression level 9"""
+
+    @lazyproperty
+    def _zipf(self):
+        return zipfile.ZipFile(
+            self._pkg_file, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=9,
+            strict_timestamps=False
+        )
+
+class SortedPackageWriter(PackageWriter):
+    """PackageWriter that writes parts in partname order at maximum deflate level
+
+    Similar XML parts (slides, layouts) sit next to each other in the archive.
+    """
+
+    def _write(self):
+        with _MaxDeflateZipPkgWriter(self._pkg_file) as phys_writer:
+            self._write_content_types_stream(phys_writer)
+            self._write_pkg_rels(phys_writer)
+            self._write_parts(phys_writer)
+
+    def _write_parts(self, phys_writer):
+        for part in sorted(self._parts, key=lambda part: part.partname):
+            phys_writer.write(part.partname, part.blob)
+            if part._rels:
+                phys_writer.write(part.partname.rels_uri, part.rels.xml)
+
+def save_presentation(prs, path):
+    """Save `prs` to `path` through SortedPackageWriter
+
+    The package is written to a temporary file through a large buffer and then moved
+    over `path`, so a failed save never leaves a partial file behind.
+    """
+    package = prs.part.package
+    # A unique name in the same directory keeps os.replace atomic even when several
+    # workers save to the same path
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+            SortedPackageWriter.write(f, package._rels, tuple(package.iter_parts()))
+        # mkstemp creates the file 0600; give the deck the usual umask-based mode
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def content_digest():
+    """Return a SHA-256 hex digest of everything that determines the generated deck
+
+    This script holds all of the deck's data, text and styling, so its source plus the
+    python-pptx version stand in for the logical content.
+    """
+    with open(__file__, "rb") as f:
+        source = f.read()
+    return hashlib.sha256(source + pptx.__version__.encode()).hexdigest()
+
+def is_up_to_date(output_file, digest):
+    """Return True when `output_file` exists and was generated from content `digest`"""
+    try:
+        with open(output_file + ".hash") as f:
+            stored_digest = f.read()
+    except FileNotFoundError:
+        return False
+    return stored_digest == digest and os.path.exists(output_file)
+
+def write_digest(hash_file, digest):
+    """Atomically write `digest` to `hash_file` via a temporary file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(hash_file) or ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(digest)
+        os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, hash_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def build_paragraph_xml(text, sz, bold=False, rgb=None):
+    """Return the `<a:p>` XML for a single-run paragraph with inline font styling"""
+    rpr_attrs = ' sz="%d"' % (sz * 100)
+    if bold:
+        rpr_attrs += ' b="1"'
+    fill = ""
+    if rgb is not None:
+        fill = '<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' % str(rgb)
+    if not text:
+        return '<a:p><a:endParaRPr%s>%s</a:endParaRPr></a:p>' % (rpr_attrs, fill)
+    return '<a:p><a:r><a:rPr%s>%s</a:rPr><a:t>%s</a:t></a:r></a:p>' % (
+        rpr_attrs, fill, escape(text)
+    )
+
+def make_body_paragraph(text, bullet, space_before=False):
+    """Return an `<a:p>` element for one content slide item, copied from a prototype"""
+    p = copy.deepcopy(_BULLET_PROTO if bullet else _HEADING_PROTO)
+    p[-1][-1].text = text
+    if space_before:
+        p[0].insert(0, copy.deepcopy(_SPACE_BEFORE_PROTO))
+    return p
+
+def build_body_paragraphs(content_items):
+    """Return `<a:p>` elements for content items, turning bullet prefixes into real bullets
+
+    Empty items are not emitted; they add space before the next paragraph instead.
+    """
+    paragraphs = []
+    space_before = False
+    for item in content_items:
+        if not item:
+            space_before = True
+            continue
+        if item.startswith(BULLET_PREFIX):
+            paragraphs.append(make_body_paragraph(item[len(BULLET_PREFIX):], True, space_before))
+        else:
+            paragraphs.append(make_body_paragraph(item, False, space_before))
+        space_before = False
+    return paragraphs
+
+def parse_paragraphs(paragraphs_xml):
+    """Parse a sequence of `<a:p>` XML strings in a single pass"""
+    fragment = parse_xml("<a:txBody %s>%s</a:txBody>" % (nsdecls("a"), "".join(paragraphs_xml)))
+    return list(fragment)
+
+def set_cell_paragraph(tc, p):
+    """Replace the paragraphs of table cell element `tc` with `<a:p>` element `p`"""
+    txBody = tc.get_or_add_txBody()
+    for old_p in txBody.p_lst:
+        txBody.remove(old_p)
+    txBody.append(p)
+
+def add_title_slide(prs, layout, title, subtitle):
     """Add a title slide"""
-    slide_layout = prs.slide_layouts[0]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(layout)
     
     title_shape = slide.shapes.title
     subtitle_shape = slide.placeholders[1]
@@ -21,99 +218,167 @@ def add_title_slide(prs, title, subtitle):
     subtitle_shape.text = subtitle
     
     # Style the title
-    title_shape.text_frame.paragraphs[0].font.size = Pt(44)
-    title_shape.text_frame.paragraphs[0].font.bold = True
-    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+    font = title_shape.text_frame.paragraphs[0].font
+    font.size = PT_44
+    font.bold = True
+    font.color.rgb = BRAND_BLUE
     
     return slide
 
-def add_content_slide(prs, title, content_items):
+def add_content_slide(prs, layout, title, content_items):
     """Add a content slide with bullet points"""
-    slide_layout = prs.slide_layouts[1]
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(layout)
     
     title_shape = slide.shapes.title
     title_shape.text = title
-    title_shape.text_frame.paragraphs[0].font.size = Pt(32)
-    title_shape.text_frame.paragraphs[0].font.bold = True
-    title_shape.text_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
-    
-    body_shape = slide.placeholders[1]
-    text_frame = body_shape.text_frame
-    text_frame.clear()
+    font = title_shape.text_frame.paragraphs[0].font
+    font.size = PT_32
+    font.bold = True
+    font.color.rgb = BRAND_BLUE
     
-    for item in content_items:
-        p = text_frame.add_paragraph()
-        p.text = item
-        p.level = 0
-        p.font.size = Pt(18)
-        p.space_after = Pt(12)
+    # Swap the placeholder's paragraphs for the new ones in one batch
+    txBody = slide.placeholders[1].text_frame._txBody
+    for p in txBody.findall(qn("a:p")):
+        txBody.remove(p)
+    # A txBody must hold at least one paragraph, so fall back to an empty one
+    txBody.extend(build_body_paragraphs(content_items) or [OxmlElement("a:p")])
     
     return slide
 
-def add_table_slide(prs, title, headers, data):
+def add_table_slide(prs, layout, title, headers, data):
     """Add a slide with a table"""
-    slide_layout = prs.slide_layouts[5]  # Blank layout
-    slide = prs.slides.add_slide(slide_layout)
+    slide = prs.slides.add_slide(layout)
     
     # Add title
-    left = Inches(0.5)
-    top = Inches(0.5)
-    width = Inches(9)
-    height = Inches(0.8)
-    
-    title_box = slide.shapes.add_textbox(left, top, width, height)
+    title_box = slide.shapes.add_textbox(IN_0_5, IN_0_5, IN_9, IN_0_8)
     title_frame = title_box.text_frame
     title_frame.text = title
-    title_frame.paragraphs[0].font.size = Pt(32)
-    title_frame.paragraphs[0].font.bold = True
-    title_frame.paragraphs[0].font.color.rgb = RGBColor(0, 51, 102)
+    font = title_frame.paragraphs[0].font
+    font.size = PT_32
+    font.bold = True
+    font.color.rgb = BRAND_BLUE
     
     # Add table
     rows = len(data) + 1
     cols = len(headers)
-    left = Inches(0.5)
-    top = Inches(1.5)
-    width = Inches(9)
-    height = Inches(4.5)
+    width = IN_9
     
-    table = slide.shapes.add_table(rows, cols, left, top, width, height).table
+    table = slide.shapes.add_table(rows, cols, IN_0_5, IN_1_5, width, IN_4_5).table
+    tcs = list(table._tbl.iter_tcs())
     
     # Set column widths
-    for i in range(cols):
-        table.columns[i].width = Inches(width.inches / cols)
+    col_width = int(width / cols)
+    for gridCol in table._tbl.tblGrid.gridCol_lst:
+        gridCol.w = col_width
+    
+    # Parse every cell's paragraph in one pass, in the same order as tcs
+    cell_paragraphs = parse_paragraphs(
+        [build_paragraph_xml(header, 14, bold=True, rgb=WHITE) for header in headers]
+        + [build_paragraph_xml(str(value), 12) for row in data for value in row]
+    )
     
     # Add headers
-    for i, header in enumerate(headers):
-        cell = table.cell(0, i)
-        cell.text = header
-        cell.text_frame.paragraphs[0].font.bold = True
-        cell.text_frame.paragraphs[0].font.size = Pt(14)
-        cell.fill.solid()
-        cell.fill.fore_color.rgb = RGBColor(0, 51, 102)
-        cell.text_frame.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
+    for i in range(len(headers)):
+        tc = tcs[i]
+        set_cell_paragraph(tc, cell_paragraphs[i])
+        tc.get_or_add_tcPr().append(copy.deepcopy(HEADER_FILL_XML))
     
     # Add data
     for i, row in enumerate(data):
-        for j, value in enumerate(row):
-            cell = table.cell(i + 1, j)
-            cell.text = str(value)
-            cell.text_frame.paragraphs[0].font.size = Pt(12)
+        for j in range(len(row)):
+            k = (i + 1) * cols + j
+            tc = tcs[k]
+            set_cell_paragraph(tc, cell_paragraphs[k])
             if i % 2 == 0:
-                cell.fill.solid()
-                cell.fill.fore_color.rgb = RGBColor(240, 240, 240)
+                tc.get_or_add_tcPr().append(copy.deepcopy(ROW_FILL_XML))
     
     return slide
 
-def create_ntpc_presentation():
+@functools.lru_cache(maxsize=None, typed=True)
+def format_inr(amount):
+    """Format a whole rupee amount with Indian digit grouping, e.g. 385000 -> "₹3,85,000"
+
+    Negative amounts carry the sign ahead of the rupee symbol, e.g. -50000 -> "-₹50,000".
+    Raises TypeError when `amount` is not an int.
+    """
+    if not isinstance(amount, int) or isinstance(amount, bool):
+        raise TypeError("amount must be a whole number of rupees, got %r" % (amount,))
+    sign = "-" if amount < 0 else ""
+    digits = str(abs(amount))
+    head, tail = digits[:-3], digits[-3:]
+    groups = [head[max(i - 2, 0):i] for i in range(len(head), 0, -2)]
+    groups.reverse()
+    groups.append(tail)
+    return sign + "₹" + ",".join(groups)
+
+def inr_row(label, *amounts):
+    """Return a table row of `label` followed by each amount formatted as rupees"""
+    return (label,) + tuple(format_inr(amount) for amount in amounts)
+
+# Table slide data, built once at import
+
+# Slide 4: Balance Sheet - 5 Year Trends
+BALANCE_SHEET_HEADERS = ("Year", "Total Assets (Cr)", "Fixed Assets (Cr)", "Total Liabilities (Cr)", "Borrowings (Cr)", "Equity (Cr)")
+BALANCE_SHEET_DATA = (
+    inr_row("FY 2019-20", 385000, 215000, 170000, 145000, 25000),
+    inr_row("FY 2020-21", 405000, 225000, 180000, 152000, 28000),
+    inr_row("FY 2021-22", 435000, 240000, 195000, 162000, 33000),
+    inr_row("FY 2022-23", 465000, 255000, 210000, 172000, 38000),
+    inr_row("FY 2023-24", 495000, 270000, 225000, 180000, 45000),
+)
+
+# Slide 5: Profit & Loss Account - 5 Year Trends
+PL_HEADERS = ("Year", "Revenue (Cr)", "Operating Exp (Cr)", "EBITDA (Cr)", "PAT (Cr)", "EPS (₹)")
+PL_DATA = (
+    inr_row("FY 2019-20", 115000, 95000, 20000, 14500, 5500),
+    inr_row("FY 2020-21", 118500, 97500, 21000, 15200, 5800),
+    inr_row("FY 2021-22", 132000, 105000, 27000, 19500, 7500),
+    inr_row("FY 2022-23", 148000, 115000, 33000, 24000, 9000),
+    inr_row("FY 2023-24", 162000, 122000, 40000, 29000, 11000),
+)
+
+# Slide 6: Key Financial Ratios
+RATIO_HEADERS = ("Year", "EBITDA Margin", "Net Margin", "Current Ratio", "Debt-Equity", "ROE")
+RATIO_DATA = (
+    ("FY 2019-20", "17.4%", "12.6%", "0.85", "2.2", "22%"),
+    ("FY 2020-21", "17.7%", "12.8%", "0.88", "2.3", "21%"),
+    ("FY 2021-22", "20.5%", "14.8%", "0.92", "2.4", "23%"),
+    ("FY 2022-23", "22.3%", "16.2%", "0.95", "2.5", "25%"),
+    ("FY 2023-24", "24.7%", "17.9%", "0.98", "2.6", "27%"),
+)
+
+# Slide 7: Benchmarking - Industry Comparison
+BENCHMARK_HEADERS = ("Company", "Revenue (Cr)", "EBITDA %", "Net Margin %", "ROE %", "D/E Ratio")
+BENCHMARK_DATA = (
+    ("NTPC", format_inr(162000), "24.7%", "17.9%", "27%", "2.6"),
+    ("Power Grid", format_inr(42500), "52.8%", "28.5%", "18%", "1.8"),
+    ("Tata Power", format_inr(58000), "18.2%", "8.5%", "15%", "3.2"),
+    ("Adani Power", format_inr(52000), "28.5%", "12.3%", "22%", "4.5"),
+    ("Industry Avg", format_inr(78625), "31.1%", "16.8%", "20.5%", "3.0"),
+)
+
+def create_ntpc_presentation(output_file=OUTPUT_FILE):
     """Create the complete NTPC presentation"""
+    # Skip the whole build when the deck on disk already matches the content
+    digest = content_digest()
+    if is_up_to_date(output_file, digest):
+        print(f"✓ Presentation unchanged, skipping: {output_file}")
+        return output_file
+    
     prs = Presentation()
-    prs.slide_width = Inches(10)
-    prs.slide_height = Inches(7.5)
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+    
+    # Look up the layouts once and share them across slides
+    slide_layouts = prs.slide_layouts
+    title_layout = slide_layouts[0]
+    content_layout = slide_layouts[1]
+    table_layout = slide_layouts[5]  # Title Only layout
     
     # Slide 1: Title Slide
     add_title_slide(
         prs,
+        title_layout,
         "NTPC Limited",
         "Financial Analysis & Performance Review\n(5-Year Comprehensive Study)"
     )
@@ -121,6 +386,7 @@ def create_ntpc_presentation():
     # Slide 2: Introduction to the Company
     add_content_slide(
         prs,
+        content_layout,
         "Introduction to NTPC Limited",
         [
             "Industry Overview:",
@@ -144,6 +410,7 @@ def create_ntpc_presentation():
     # Slide 3: Accounting Process & Data Sources
     add_content_slide(
         prs,
+        content_layout,
         "Accounting Process & Financial Data Sources",
         [
             "Accounting Framework:",
@@ -165,72 +432,45 @@ def create_ntpc_presentation():
     )
     
     # Slide 4: Balance Sheet - 5 Year Trends
-    balance_sheet_data = [
-        ["FY 2019-20", "₹3,85,000", "₹2,15,000", "₹1,70,000", "₹1,45,000", "₹25,000"],
-        ["FY 2020-21", "₹4,05,000", "₹2,25,000", "₹1,80,000", "₹1,52,000", "₹28,000"],
-        ["FY 2021-22", "₹4,35,000", "₹2,40,000", "₹1,95,000", "₹1,62,000", "₹33,000"],
-        ["FY 2022-23", "₹4,65,000", "₹2,55,000", "₹2,10,000", "₹1,72,000", "₹38,000"],
-        ["FY 2023-24", "₹4,95,000", "₹2,70,000", "₹2,25,000", "₹1,80,000", "₹45,000"]
-    ]
-    
     add_table_slide(
         prs,
+        table_layout,
         "Balance Sheet Summary (5-Year Trends)",
-        ["Year", "Total Assets (Cr)", "Fixed Assets (Cr)", "Total Liabilities (Cr)", "Borrowings (Cr)", "Equity (Cr)"],
-        balance_sheet_data
+        BALANCE_SHEET_HEADERS,
+        BALANCE_SHEET_DATA
     )
     
     # Slide 5: Profit & Loss Account - 5 Year Trends
-    pl_data = [
-        ["FY 2019-20", "₹1,15,000", "₹95,000", "₹20,000", "₹14,500", "₹5,500"],
-        ["FY 2020-21", "₹1,18,500", "₹97,500", "₹21,000", "₹15,200", "₹5,800"],
-        ["FY 2021-22", "₹1,32,000", "₹1,05,000", "₹27,000", "₹19,500", "₹7,500"],
-        ["FY 2022-23", "₹1,48,000", "₹1,15,000", "₹33,000", "₹24,000", "₹9,000"],
-        ["FY 2023-24", "₹1,62,000", "₹1,22,000", "₹40,000", "₹29,000", "₹11,000"]
-    ]
-    
     add_table_slide(
         prs,
+        table_layout,
         "Profit & Loss Account (5-Year Trends)",
-        ["Year", "Revenue (Cr)", "Operating Exp (Cr)", "EBITDA (Cr)", "PAT (Cr)", "EPS (₹)"],
-        pl_data
+        PL_HEADERS,
+        PL_DATA
     )
     
     # Slide 6: Key Financial Ratios
-    ratio_data = [
-        ["FY 2019-20", "17.4%", "12.6%", "0.85", "2.2", "22%"],
-        ["FY 2020-21", "17.7%", "12.8%", "0.88", "2.3", "21%"],
-        ["FY 2021-22", "20.5%", "14.8%", "0.92", "2.4", "23%"],
-        ["FY 2022-23", "22.3%", "16.2%", "0.95", "2.5", "25%"],
-        ["FY 2023-24", "24.7%", "17.9%", "0.98", "2.6", "27%"]
-    ]
-    
     add_table_slide(
         prs,
+        table_layout,
         "Key Financial Ratios & Performance Metrics",
-        ["Year", "EBITDA Margin", "Net Margin", "Current Ratio", "Debt-Equity", "ROE"],
-        ratio_data
+        RATIO_HEADERS,
+        RATIO_DATA
     )
     
     # Slide 7: Benchmarking - Industry Comparison
-    benchmark_data = [
-        ["NTPC", "₹1,62,000", "24.7%", "17.9%", "27%", "2.6"],
-        ["Power Grid", "₹42,500", "52.8%", "28.5%", "18%", "1.8"],
-        ["Tata Power", "₹58,000", "18.2%", "8.5%", "15%", "3.2"],
-        ["Adani Power", "₹52,000", "28.5%", "12.3%", "22%", "4.5"],
-        ["Industry Avg", "₹78,625", "31.1%", "16.8%", "20.5%", "3.0"]
-    ]
-    
     add_table_slide(
         prs,
+        table_layout,
         "Benchmarking: Comparison with Competitors (FY 2023-24)",
-        ["Company", "Revenue (Cr)", "EBITDA %", "Net Margin %", "ROE %", "D/E Ratio"],
-        benchmark_data
+        BENCHMARK_HEADERS,
+        BENCHMARK_DATA
     )
     
     # Slide 8: Key Findings & Interpretations
     add_content_slide(
         prs,
+        content_layout,
         "Key Findings & Interpretations",
         [
             "Performance Improvements:",
@@ -255,6 +495,7 @@ def create_ntpc_presentation():
     # Slide 9: Recommendations & Conclusion
     add_content_slide(
         prs,
+        content_layout,
         "Recommendations & Conclusion",
         [
             "Strategic Recommendations:",
@@ -276,11 +517,22 @@ def create_ntpc_presentation():
         ]
     )
     
-    # Save presentation
-    output_file = "/vercel/sandbox/NTPC_Financial_Analysis_Presentation.pptx"
-    prs.save(output_file)
+    # Save presentation; drop the old digest first so an interrupted run can never
+    # leave it next to a deck it does not describe
+    hash_file = output_file + ".hash"
+    try:
+        os.remove(hash_file)
+    except FileNotFoundError:
+        pass
+    save_presentation(prs, output_file)
+    write_digest(hash_file, digest)
     print(f"✓ Presentation created successfully: {output_file}")
     return output_file
 
+def create_ntpc_presentations(output_files, max_workers=None):
+    """Create one NTPC presentation per path in `output_files` using worker processes"""
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(create_ntpc_presentation, output_files))
+
 if __name__ == "__main__":
     create_ntpc_presentation()